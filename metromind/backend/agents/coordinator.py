@@ -2,78 +2,82 @@
 CoordinatorAgent v2 — Allocates global resource capacities across districts and train lines.
 Cost-aware: tracks standby reserve cost in allocation decisions.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, Tuple
 from ..models import CityState
 
 
 class CoordinatorAgent:
     """Coordinates resource allocation with limited capacities."""
 
-    def allocate(self, city: CityState, proposals: Dict[str, Any]) -> Dict[str, Any]:
-        """Allocate bus and train service units across districts and lines."""
+    def allocate(self, city: CityState,
+                 proposals: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Allocate bus and train service units across districts and lines.
+
+        Returns (approved proposals, coordinator trace).
+        """
         allocations = []
 
         # Reserve ~20-30% buffer
         bus_available = max(0, city.bus_service_units_active - round(city.bus_service_units_max * 0.2))
         train_available = max(0, city.train_service_units_active - round(city.train_service_units_max * 0.2))
 
-        # District bus allocation
+        # District bus allocation (proposals mutated in place, no copies)
         sorted_districts = sorted(proposals["district_proposals"],
-                                  key=lambda p: p["urgency"], reverse=True)
+                                  key=lambda p: p.urgency, reverse=True)
         bus_left = bus_available
         approved_districts = []
 
         for proposal in sorted_districts:
-            approved = proposal.copy()
-            if proposal["bus_action"] == "DEPLOY_RESERVE" and proposal["bus_extra"] > 0:
-                allocated = min(proposal["bus_extra"], bus_left)
-                approved["bus_extra"] = allocated
+            if proposal.bus_action == "DEPLOY_RESERVE" and proposal.bus_extra > 0:
+                requested = proposal.bus_extra
+                allocated = min(requested, bus_left)
+                proposal.bus_extra = allocated
                 bus_left -= allocated
                 if allocated == 0:
-                    approved["bus_action"] = "NO_CHANGE"
+                    proposal.bus_action = "NO_CHANGE"
                     allocations.append(
-                        f"{proposal['district']}: requested +{proposal['bus_extra']} units, "
+                        f"{proposal.district}: requested +{requested} units, "
                         f"denied (reserve limit)"
                     )
-                elif allocated < proposal["bus_extra"]:
+                elif allocated < requested:
                     allocations.append(
-                        f"{proposal['district']}: requested +{proposal['bus_extra']} units, "
+                        f"{proposal.district}: requested +{requested} units, "
                         f"allocated +{allocated} (partial)"
                     )
                 else:
                     allocations.append(
-                        f"{proposal['district']}: allocated +{allocated} reserve bus units"
+                        f"{proposal.district}: allocated +{allocated} reserve bus units"
                     )
-            approved_districts.append(approved)
+            approved_districts.append(proposal)
 
         # Train line allocation
         sorted_trains = sorted(proposals["train_proposals"],
-                               key=lambda p: p["urgency"], reverse=True)
+                               key=lambda p: p.urgency, reverse=True)
         train_left = train_available
         approved_trains = []
 
         for proposal in sorted_trains:
-            approved = proposal.copy()
-            if proposal["mrt_action"] == "ADD_TRAINS" and proposal["mrt_extra"] > 0:
-                allocated = min(proposal["mrt_extra"], train_left)
-                approved["mrt_extra"] = allocated
+            if proposal.mrt_action == "ADD_TRAINS" and proposal.mrt_extra > 0:
+                requested = proposal.mrt_extra
+                allocated = min(requested, train_left)
+                proposal.mrt_extra = allocated
                 train_left -= allocated
                 if allocated == 0:
-                    approved["mrt_action"] = "NO_CHANGE"
+                    proposal.mrt_action = "NO_CHANGE"
                     allocations.append(
-                        f"{proposal['line_id']}: requested +{proposal['mrt_extra']} units, "
+                        f"{proposal.line_id}: requested +{requested} units, "
                         f"denied (reserve limit)"
                     )
-                elif allocated < proposal["mrt_extra"]:
+                elif allocated < requested:
                     allocations.append(
-                        f"{proposal['line_id']}: requested +{proposal['mrt_extra']} units, "
+                        f"{proposal.line_id}: requested +{requested} units, "
                         f"allocated +{allocated} (partial)"
                     )
                 else:
                     allocations.append(
-                        f"{proposal['line_id']}: allocated +{allocated} train service units"
+                        f"{proposal.line_id}: allocated +{allocated} train service units"
                     )
-            approved_trains.append(approved)
+            approved_trains.append(proposal)
 
         # Cost note in trace
         idle_reserve = bus_left + train_left
@@ -83,14 +87,14 @@ class CoordinatorAgent:
                 f"(standby cost applies)"
             )
 
-        return {
+        approved = {
             "district_proposals": approved_districts,
             "train_proposals": approved_trains,
-            "_trace": {
-                "allocations": allocations,
-                "remaining_capacity": {
-                    "bus_service_units": bus_left,
-                    "train_service_units": train_left,
-                },
+        }
+        return approved, {
+            "allocations": allocations,
+            "remaining_capacity": {
+                "bus_service_units": bus_left,
+                "train_service_units": train_left,
             },
         }
@@ -17,48 +17,48 @@ class ExecutionAgent:
 
         # District (bus) actions
         for proposal in approved["district_proposals"]:
-            district_name = proposal["district"]
-            district = next((d for d in city.districts if d.name == district_name), None)
+            district_name = proposal.district
+            district = city.districts_by_name.get(district_name)
             if district is None:
                 continue
 
             actions_taken = []
 
             # 1. Crowd management (safety first)
-            if proposal.get("do_crowd_mgmt"):
+            if proposal.do_crowd_mgmt:
                 district.station_crowding *= 0.85
                 actions_taken.append("CROWD_MGMT")
 
             # 2. Bus reserve deployment
-            if proposal["bus_action"] == "DEPLOY_RESERVE" and proposal["bus_extra"] > 0:
-                district.bus_capacity += proposal["bus_extra"]
+            if proposal.bus_action == "DEPLOY_RESERVE" and proposal.bus_extra > 0:
+                district.bus_capacity += proposal.bus_extra
                 district.bus_load_factor *= 0.95
-                actions_taken.append(f"DEPLOY_RESERVE +{proposal['bus_extra']}")
+                actions_taken.append(f"DEPLOY_RESERVE +{proposal.bus_extra}")
 
             # 3. Short-turn (cut route early to boost frequency in hot segment)
-            if proposal.get("do_short_turn") or proposal["bus_action"] == "SHORT_TURN":
+            if proposal.do_short_turn or proposal.bus_action == "SHORT_TURN":
                 district.bus_load_factor *= 0.94
                 district.road_traffic *= 0.97
                 actions_taken.append("SHORT_TURN")
 
             # 4. Hold at terminal (headway regulation to reduce bunching)
-            if proposal.get("do_hold_terminal"):
+            if proposal.do_hold_terminal:
                 district.bus_load_factor *= 0.98
                 actions_taken.append("HOLD_AT_TERMINAL")
 
             # 5. Reroute around incident
-            if proposal.get("do_reroute"):
+            if proposal.do_reroute:
                 district.road_traffic *= 0.95
                 actions_taken.append("REROUTE_AROUND_INCIDENT")
 
             # 6. Travel advisory (replaces nudge — off-peak only)
-            if proposal.get("do_advisory"):
+            if proposal.do_advisory:
                 district.nudges_active = True
                 district.nudge_timer = 3
                 actions_taken.append("TRAVEL_ADVISORY")
 
             # 7. Escalation to human operator
-            if proposal.get("do_escalate"):
+            if proposal.do_escalate:
                 city.operator_escalations.append({
                     "t": city.t,
                     "hour": city.hour_of_day,
@@ -76,14 +76,14 @@ class ExecutionAgent:
                     "type": "district",
                     "district": district_name,
                     "actions": actions_taken,
-                    "urgency": round(proposal["urgency"], 2),
+                    "urgency": round(proposal.urgency, 2),
                 }
                 action_events.append(event)
                 city.action_log.append(event)
 
         # Train line actions
         for proposal in approved["train_proposals"]:
-            line_id = proposal["line_id"]
+            line_id = proposal.line_id
             line = city.train_lines.get(line_id)
             if line is None:
                 continue
@@ -91,21 +91,21 @@ class ExecutionAgent:
             actions_taken = []
 
             # Add trains
-            if proposal["mrt_action"] == "ADD_TRAINS" and proposal["mrt_extra"] > 0:
-                line.frequency += proposal["mrt_extra"]
+            if proposal.mrt_action == "ADD_TRAINS" and proposal.mrt_extra > 0:
+                line.frequency += proposal.mrt_extra
                 line.line_load *= 0.95
-                action_str = f"ADD_TRAINS +{proposal['mrt_extra']}"
+                action_str = f"ADD_TRAINS +{proposal.mrt_extra}"
                 actions_taken.append(action_str)
                 line.actions_this_hour.append(action_str)
 
             # Hold headway (spacing control)
-            if proposal.get("do_hold_headway"):
+            if proposal.do_hold_headway:
                 line.line_load *= 0.98
                 actions_taken.append("HOLD_HEADWAY")
                 line.actions_this_hour.append("HOLD_HEADWAY")
 
             # Escalation
-            if proposal.get("do_escalate"):
+            if proposal.do_escalate:
                 city.operator_escalations.append({
                     "t": city.t,
                     "hour": city.hour_of_day,
@@ -125,7 +125,7 @@ class ExecutionAgent:
                     "line_id": line_id,
                     "line_name": line.line_name,
                     "actions": actions_taken,
-                    "urgency": round(proposal["urgency"], 2),
+                    "urgency": round(proposal.urgency, 2),
                 }
                 action_events.append(event)
                 city.action_log.append(event)
@@ -8,7 +8,17 @@ from ..models import CityState, BUS_TARGET_LF, MRT_TARGET_LF, CROWDING_CRITICAL
 class MonitoringAgent:
     """Observes city state and produces observation reports."""
 
+    def __init__(self):
+        # Single-entry memo: observations are pure reads of city state,
+        # so repeat calls within the same tick reuse the last report.
+        self._cache_key = None
+        self._cache_obs: Dict[str, Any] = None
+
     def observe(self, city: CityState) -> Dict[str, Any]:
+        key = (id(city), city.reset_epoch, city.t)
+        if key == self._cache_key:
+            return self._cache_obs
+
         observations = {
             "t": city.t,
             "hour": city.hour_of_day,
@@ -41,6 +51,8 @@ class MonitoringAgent:
                 "disruption_level": line.disruption_level,
             }
 
+        self._cache_key = key
+        self._cache_obs = observations
         return observations
 
     def _generate_alerts(self, city: CityState) -> List[str]:
@@ -8,7 +8,8 @@ Generates action proposals using feasible operational controls:
 """
 from typing import Dict, Any, List
 from ..models import (
-    CityState, BUS_TARGET_LF, MRT_TARGET_LF, CROWDING_CRITICAL, PEAK_HOURS,
+    CityState, DistrictProposal, TrainProposal,
+    BUS_TARGET_LF, MRT_TARGET_LF, CROWDING_CRITICAL, PEAK_HOURS,
 )
 
 
@@ -132,18 +133,18 @@ class CapacityPlannerAgent:
                         f"alternative routes recommended (forecast: {fc_peak:.0%})"
                     )
 
-            district_proposals.append({
-                "district": district.name,
-                "bus_action": bus_action,
-                "bus_extra": bus_extra,
-                "do_crowd_mgmt": do_crowd_mgmt,
-                "do_advisory": do_advisory,
-                "do_short_turn": do_short_turn,
-                "do_hold_terminal": do_hold_terminal,
-                "do_reroute": do_reroute,
-                "do_escalate": do_escalate,
-                "urgency": urgency,
-            })
+            district_proposals.append(DistrictProposal(
+                district=district.name,
+                bus_action=bus_action,
+                bus_extra=bus_extra,
+                do_crowd_mgmt=do_crowd_mgmt,
+                do_advisory=do_advisory,
+                do_short_turn=do_short_turn,
+                do_hold_terminal=do_hold_terminal,
+                do_reroute=do_reroute,
+                do_escalate=do_escalate,
+                urgency=urgency,
+            ))
 
         # Train line proposals
         train_proposals = []
@@ -203,14 +204,14 @@ class CapacityPlannerAgent:
                     f"{line_obs['disruption_level']:.0%} exceeds threshold"
                 )
 
-            train_proposals.append({
-                "line_id": line_id,
-                "mrt_action": mrt_action,
-                "mrt_extra": mrt_extra,
-                "do_hold_headway": do_hold_headway,
-                "do_escalate": do_escalate_line,
-                "urgency": urgency,
-            })
+            train_proposals.append(TrainProposal(
+                line_id=line_id,
+                mrt_action=mrt_action,
+                mrt_extra=mrt_extra,
+                do_hold_headway=do_hold_headway,
+                do_escalate=do_escalate_line,
+                urgency=urgency,
+            ))
 
         # Include forecast alerts in reasoning
         for alert in forecast_alerts:
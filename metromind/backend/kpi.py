@@ -2,30 +2,33 @@
 KPI calculations and scoring for the MetroMind v2 city simulation.
 Includes liveability, environment, and cost efficiency scores.
 """
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Mapping
 from .models import CityState, BUS_TARGET_LF, MRT_TARGET_LF
 
 
-def snapshot_metrics(city: CityState) -> Dict[str, float]:
-    """Compute aggregate metrics across all districts."""
-    n = len(city.districts)
-    if n == 0:
-        return {
-            "avg_station": 0.0, "avg_bus_load": 0.0,
-            "avg_mrt_load": 0.0, "avg_traffic": 0.0, "avg_air": 0.0,
-        }
+def snapshot_metrics(city: CityState) -> Mapping[str, float]:
+    """Compute aggregate metrics across all districts.
 
-    return {
+    The district count is fixed at construction (CityState asserts it is
+    non-zero), so no len()/empty guard is needed here. The result is a
+    read-only view: callers share it by reference instead of copying.
+    """
+    n = city.n_districts
+    return MappingProxyType({
         "avg_station": round(sum(d.station_crowding for d in city.districts) / n, 3),
         "avg_bus_load": round(sum(d.bus_load_factor for d in city.districts) / n, 3),
         "avg_mrt_load": round(sum(d.mrt_load_factor for d in city.districts) / n, 3),
         "avg_traffic": round(sum(d.road_traffic for d in city.districts) / n, 3),
         "avg_air": round(sum(d.air_quality for d in city.districts) / n, 1),
-    }
+    })
 
 
-def score(city: CityState) -> Dict[str, float]:
-    """Compute liveability, environment, and cost scores (0-100, higher is better)."""
+def score(city: CityState) -> Mapping[str, float]:
+    """Compute liveability, environment, and cost scores (0-100, higher is better).
+
+    Returns a read-only view, like snapshot_metrics.
+    """
     snap = snapshot_metrics(city)
 
     # Also factor in train line loads
@@ -60,8 +63,8 @@ def score(city: CityState) -> Dict[str, float]:
     environment = max(0, min(100, environment))
     cost_score = max(0, min(100, cost_score))
 
-    return {
+    return MappingProxyType({
         "liveability_score": round(liveability, 1),
         "environment_score": round(environment, 1),
         "cost_score": round(cost_score, 1),
-    }
+    })
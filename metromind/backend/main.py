@@ -1,14 +1,36 @@
 """
 FastAPI backend for MetroMind / UrbanPulse.
 """
+import orjson
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from .orchestrator import make_city, Orchestrator
+from fastapi.responses import ORJSONResponse
+from .orchestrator import make_city, reset_city_state, Orchestrator, json_default
+
+
+class PayloadResponse(ORJSONResponse):
+    """ORJSONResponse that understands the orchestrator payload types.
+
+    Handlers construct this directly around orchestrator payloads, so
+    FastAPI sends the pre-encoded bytes as-is instead of running its
+    response-serialization pass over the dict tree.
+
+    This relies on _build_payload returning a fresh top-level dict per
+    call: the json_default callback yields the GIL mid-dump, so orjson
+    must never walk a dict another request could still mutate. Only the
+    orchestrator's immutable per-tick views may be shared across
+    payloads.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=json_default)
+
 
 app = FastAPI(
     title="MetroMind API",
     description="Agentic AI for Smart Urban Transit Management",
     version="2.0.0",
+    default_response_class=PayloadResponse,
 )
 
 app.add_middleware(
@@ -34,15 +56,15 @@ orchestrator = Orchestrator()
 
 
 @app.get("/api/state")
-def get_state():
+async def get_state():
     """Get current city state without advancing time."""
-    return orchestrator.get_state(city)
+    return PayloadResponse(orchestrator.get_state(city))
 
 
 @app.post("/api/step")
-def do_step():
+async def do_step():
     """Advance simulation by one step."""
-    return orchestrator.step(city)
+    return PayloadResponse(orchestrator.step(city))
 
 
 @app.post("/api/simulate")
@@ -55,7 +77,7 @@ def simulate(hour: int = Query(ge=0, le=23)):
     current_hour = city.hour_of_day
 
     if target_hour == current_hour:
-        return orchestrator.step(city)
+        return PayloadResponse(orchestrator.step(city))
 
     if target_hour > current_hour:
         steps_needed = target_hour - current_hour
@@ -67,7 +89,7 @@ def simulate(hour: int = Query(ge=0, le=23)):
     result = None
     for _ in range(steps_needed):
         result = orchestrator.step(city)
-    return result
+    return PayloadResponse(result)
 
 
 @app.post("/api/step_hour")
@@ -77,7 +99,7 @@ def step_hour(delta: int = Query(ge=-1, le=1)):
     delta=-1: go back 1 hour (wraps 00->23, decrements day)
     """
     if delta == 1:
-        return orchestrator.step(city)
+        return PayloadResponse(orchestrator.step(city))
     elif delta == -1:
         # Going back: we can't truly reverse, so we reset and re-simulate
         # to the target hour. For simplicity, just step forward 23 hours
@@ -85,9 +107,9 @@ def step_hour(delta: int = Query(ge=-1, le=1)):
         result = None
         for _ in range(23):
             result = orchestrator.step(city)
-        return result
+        return PayloadResponse(result)
     else:
-        return orchestrator.get_state(city)
+        return PayloadResponse(orchestrator.get_state(city))
 
 
 @app.post("/api/run")
@@ -96,19 +118,18 @@ def run_steps(n: int = Query(default=10, ge=1, le=100)):
     result = None
     for _ in range(n):
         result = orchestrator.step(city)
-    return result
+    return PayloadResponse(result)
 
 
 @app.post("/api/reset")
-def reset_city():
-    """Reset the city to initial state."""
-    global city
-    city = make_city()
-    return orchestrator.get_state(city)
+async def reset_city():
+    """Reset the city to initial state (in place, keeping the same object)."""
+    reset_city_state(city)
+    return PayloadResponse(orchestrator.get_state(city))
 
 
 @app.get("/")
-def root():
+async def root():
     return {
         "name": "MetroMind API",
         "version": "2.0.0",
@@ -2,40 +2,50 @@
 Data models for MetroMind v2 city simulation.
 Includes cost-aware operations, forecast support, and feasible interventions.
 """
+import bisect
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import Final, List, Dict, Any, NamedTuple, Optional
 import random
 
+# Upper bound for the append-only simulation logs; old entries fall off
+# instead of growing the lists without limit on long runs
+LOG_MAXLEN: Final = 10_000
+
+# history feeds the 50-entry payload tail and nothing else, so it can
+# be kept much tighter than the audit logs
+HISTORY_MAXLEN: Final = 200
+
 
 # === Constants ===
-BUS_TARGET_LF = 0.85
-MRT_TARGET_LF = 0.80
-CROWDING_CRITICAL = 0.9
-TRAFFIC_BUS_ADD_LIMIT = 0.8
-BUS_MAX_EXTRA = 10
-MRT_MAX_EXTRA = 3
+BUS_TARGET_LF: Final = 0.85
+MRT_TARGET_LF: Final = 0.80
+CROWDING_CRITICAL: Final = 0.9
+TRAFFIC_BUS_ADD_LIMIT: Final = 0.8
+BUS_MAX_EXTRA: Final = 10
+MRT_MAX_EXTRA: Final = 3
 
 # Capacity decay rate (% per hour back to baseline)
-CAPACITY_DECAY_RATE = 0.05
+CAPACITY_DECAY_RATE: Final = 0.05
 
 # Emissions (kg CO2 per unit per hour)
-BUS_EMISSIONS = 50
-MRT_EMISSIONS = 10
-TRAFFIC_EMISSIONS_FACTOR = 100
+BUS_EMISSIONS: Final = 50
+MRT_EMISSIONS: Final = 10
+TRAFFIC_EMISSIONS_FACTOR: Final = 100
 
 # === Cost Constants (Cost Units per hour) ===
-COST_BUS_ACTIVE = 8.0          # cost units per active bus service unit per hour
-COST_TRAIN_ACTIVE = 12.0       # cost units per active train service unit per hour
-COST_RESERVE_IDLE = 3.0        # standby cost per idle reserve unit per hour
-COST_CROWDING_PENALTY = 25.0   # penalty per district with crowding > 90%
-COST_DELAY_PENALTY = 15.0      # penalty per train line with disruption > 30%
-COST_ESCALATION_PENALTY = 5.0  # cost per escalation event
+COST_BUS_ACTIVE: Final = 8.0          # cost units per active bus service unit per hour
+COST_TRAIN_ACTIVE: Final = 12.0       # cost units per active train service unit per hour
+COST_RESERVE_IDLE: Final = 3.0        # standby cost per idle reserve unit per hour
+COST_CROWDING_PENALTY: Final = 25.0   # penalty per district with crowding > 90%
+COST_DELAY_PENALTY: Final = 15.0      # penalty per train line with disruption > 30%
+COST_ESCALATION_PENALTY: Final = 5.0  # cost per escalation event
 
 # Peak hours (for nudge/advisory policy)
-PEAK_HOURS = {7, 8, 9, 17, 18, 19}
+PEAK_HOURS: Final = {7, 8, 9, 17, 18, 19}
 
 # Weather types
-WEATHER_TYPES = ["Clear", "Light Rain", "Heavy Rain", "Thunderstorm", "Haze"]
+WEATHER_TYPES: Final = ["Clear", "Light Rain", "Heavy Rain", "Thunderstorm", "Haze"]
 
 # Train line definitions
 TRAIN_LINE_DEFS = {
@@ -46,33 +56,76 @@ TRAIN_LINE_DEFS = {
 }
 
 # === Event Types ===
-EVENTS = [
-    {"id": "rush_hour_surge", "name": "Rush Hour Surge", "icon": "\U0001f6a6",
-     "districts": ["Central"], "demand_mult": 1.3, "duration": 2},
-    {"id": "concert_marina", "name": "Concert at Marina Bay", "icon": "\U0001f3b5",
-     "districts": ["Central", "South"], "demand_mult": 1.4, "duration": 3},
-    {"id": "airport_rush", "name": "Changi Airport Rush", "icon": "\u2708\ufe0f",
-     "districts": ["East"], "demand_mult": 1.5, "duration": 2},
-    {"id": "jurong_event", "name": "Jurong Industrial Event", "icon": "\U0001f3ed",
-     "districts": ["West"], "demand_mult": 1.35, "duration": 2},
-    {"id": "weekend_sentosa", "name": "Sentosa Weekend Crowd", "icon": "\U0001f3dd\ufe0f",
-     "districts": ["South"], "demand_mult": 1.4, "duration": 3},
-    {"id": "mrt_maintenance", "name": "MRT Line Maintenance", "icon": "\U0001f527",
-     "districts": ["North", "Central"], "demand_mult": 1.2, "duration": 2,
-     "reduces_mrt": True, "affected_lines": ["NSL"]},
+class EventDef(NamedTuple):
+    """Immutable definition of a triggerable event type."""
+    id: str
+    name: str
+    icon: str
+    districts: tuple
+    demand_mult: float
+    duration: int
+    reduces_mrt: bool = False
+    affected_lines: tuple = ()
+    road_incident: bool = False
+
+
+EVENTS = (
+    EventDef("rush_hour_surge", "Rush Hour Surge", "\U0001f6a6",
+             ("Central",), 1.3, 2),
+    EventDef("concert_marina", "Concert at Marina Bay", "\U0001f3b5",
+             ("Central", "South"), 1.4, 3),
+    EventDef("airport_rush", "Changi Airport Rush", "\u2708\ufe0f",
+             ("East",), 1.5, 2),
+    EventDef("jurong_event", "Jurong Industrial Event", "\U0001f3ed",
+             ("West",), 1.35, 2),
+    EventDef("weekend_sentosa", "Sentosa Weekend Crowd", "\U0001f3dd\ufe0f",
+             ("South",), 1.4, 3),
+    EventDef("mrt_maintenance", "MRT Line Maintenance", "\U0001f527",
+             ("North", "Central"), 1.2, 2,
+             reduces_mrt=True, affected_lines=("NSL",)),
     # v2 new event types — operational pain points
-    {"id": "station_crowd_surge", "name": "Station Crowd Surge", "icon": "\U0001f46f",
-     "districts": ["Central"], "demand_mult": 1.45, "duration": 1},
-    {"id": "train_delay_event", "name": "Train Signal Fault", "icon": "\u26a0\ufe0f",
-     "districts": ["Central", "East"], "demand_mult": 1.25, "duration": 2,
-     "reduces_mrt": True, "affected_lines": ["EWL"]},
-    {"id": "road_incident", "name": "Road Incident (Accident)", "icon": "\U0001f6a8",
-     "districts": ["West"], "demand_mult": 1.15, "duration": 1,
-     "road_incident": True},
-]
-
-
-@dataclass
+    EventDef("station_crowd_surge", "Station Crowd Surge", "\U0001f46f",
+             ("Central",), 1.45, 1),
+    EventDef("train_delay_event", "Train Signal Fault", "\u26a0\ufe0f",
+             ("Central", "East"), 1.25, 2,
+             reduces_mrt=True, affected_lines=("EWL",)),
+    EventDef("road_incident", "Road Incident (Accident)", "\U0001f6a8",
+             ("West",), 1.15, 1,
+             road_incident=True),
+)
+
+
+@dataclass(slots=True)
+class DistrictProposal:
+    """A planner proposal for one district's bus operations.
+
+    Slot-based so the policy/coordinator stages can mutate a single
+    instance in place instead of copying dicts at every stage.
+    """
+    district: str
+    bus_action: str = "NO_CHANGE"
+    bus_extra: int = 0
+    do_crowd_mgmt: bool = False
+    do_advisory: bool = False
+    do_short_turn: bool = False
+    do_hold_terminal: bool = False
+    do_reroute: bool = False
+    do_escalate: bool = False
+    urgency: float = 0.0
+
+
+@dataclass(slots=True)
+class TrainProposal:
+    """A planner proposal for one train line."""
+    line_id: str
+    mrt_action: str = "NO_CHANGE"
+    mrt_extra: int = 0
+    do_hold_headway: bool = False
+    do_escalate: bool = False
+    urgency: float = 0.0
+
+
+@dataclass(slots=True)
 class ActiveEvent:
     """An active event affecting the city."""
     event_id: str
@@ -85,20 +138,38 @@ class ActiveEvent:
     affected_lines: List[str] = field(default_factory=list)
     road_incident: bool = False
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "event_id": self.event_id,
-            "name": self.name,
-            "icon": self.icon,
-            "districts": self.districts,
-            "demand_mult": self.demand_mult,
-            "remaining_hours": self.remaining_hours,
-            "affected_lines": self.affected_lines,
-            "road_incident": self.road_incident,
-        }
+    # Precomputed membership helpers for the per-district hot loop
+    applies_to_all: bool = field(init=False, default=False)
+    _districts_set: frozenset = field(init=False, default=frozenset())
+    # Integer district ids, resolved against the owning city on trigger
+    _district_ids: tuple = field(init=False, default=())
+
+    # Serialization cache: remaining_hours is the only field that
+    # changes after trigger, so the dict is reused until it ticks
+    _dict_cache: Optional[Dict[str, Any]] = field(init=False, default=None)
+    _dict_hours: int = field(init=False, default=-1)
 
+    def __post_init__(self):
+        self._districts_set = frozenset(self.districts)
+        self.applies_to_all = "all" in self._districts_set
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        if self._dict_cache is None or self._dict_hours != self.remaining_hours:
+            self._dict_cache = {
+                "event_id": self.event_id,
+                "name": self.name,
+                "icon": self.icon,
+                "districts": self.districts,
+                "demand_mult": self.demand_mult,
+                "remaining_hours": self.remaining_hours,
+                "affected_lines": self.affected_lines,
+                "road_incident": self.road_incident,
+            }
+            self._dict_hours = self.remaining_hours
+        return self._dict_cache
+
+
+@dataclass(slots=True)
 class WeatherState:
     """Current weather condition."""
     condition: str = "Clear"
@@ -106,16 +177,31 @@ class WeatherState:
     affected_regions: List[str] = field(default_factory=lambda: ["Islandwide"])
     persistence_hours: int = 0    # hours remaining for this weather
 
+    # Serialization cache, dirty-flagged like DistrictState: state
+    # polls between ticks reuse the last dict.
+    _dirty: bool = field(init=False, default=True, repr=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(init=False, default=None, repr=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_dirty" and name != "_cached_dict":
+            object.__setattr__(self, "_dirty", True)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        if not self._dirty and self._cached_dict is not None:
+            return self._cached_dict
+        d = {
             "condition": self.condition,
             "intensity": round(self.intensity, 2),
             "affected_regions": self.affected_regions,
             "persistence_hours": self.persistence_hours,
         }
+        object.__setattr__(self, "_cached_dict", d)
+        object.__setattr__(self, "_dirty", False)
+        return d
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainLineState:
     """State of a single MRT line."""
     line_id: str
@@ -140,7 +226,7 @@ class TrainLineState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DistrictState:
     """State of a single district (bus-focused)."""
     name: str
@@ -158,25 +244,85 @@ class DistrictState:
     nudge_timer: int = 0
     event_demand_mult: float = 1.0
 
+    # Serialization cache: any field write flips _dirty, so repeat
+    # to_dict calls between mutations reuse the last dict.
+    _dirty: bool = field(init=False, default=True, repr=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(init=False, default=None, repr=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_dirty" and name != "_cached_dict":
+            object.__setattr__(self, "_dirty", True)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        if not self._dirty and self._cached_dict is not None:
+            return self._cached_dict
+        _round = round  # local binding: six rounds per rebuild
+        d = {
             "name": self.name,
             "population": self.population,
             "bus_capacity": self.bus_capacity,
             "mrt_capacity": self.mrt_capacity,
             "base_bus_capacity": self.base_bus_capacity,
             "base_mrt_capacity": self.base_mrt_capacity,
-            "bus_load_factor": round(self.bus_load_factor, 3),
-            "mrt_load_factor": round(self.mrt_load_factor, 3),
-            "station_crowding": round(self.station_crowding, 3),
-            "road_traffic": round(self.road_traffic, 3),
-            "air_quality": round(self.air_quality, 1),
+            "bus_load_factor": _round(self.bus_load_factor, 3),
+            "mrt_load_factor": _round(self.mrt_load_factor, 3),
+            "station_crowding": _round(self.station_crowding, 3),
+            "road_traffic": _round(self.road_traffic, 3),
+            "air_quality": _round(self.air_quality, 1),
             "nudges_active": self.nudges_active,
-            "event_demand_mult": round(self.event_demand_mult, 2),
+            "event_demand_mult": _round(self.event_demand_mult, 2),
         }
+        object.__setattr__(self, "_cached_dict", d)
+        object.__setattr__(self, "_dirty", False)
+        return d
+
+
+# Weather transition rows: (threshold, condition, intensity_range,
+# persist_lo, persist_hi, region_options). The roll is compared against
+# the thresholds with bisect; the last row (threshold 1.0) is the
+# fallthrough. intensity_range None means intensity 0.0 without a draw;
+# more than one region option means a random choice between them.
+_WEATHER_AFTERNOON = (
+    (0.15, "Heavy Rain", (0.6, 0.9), 1, 3,
+     (("Islandwide",), ("East",), ("West", "Central"))),
+    (0.35, "Light Rain", (0.2, 0.5), 1, 2, (("Islandwide",),)),
+    (0.40, "Thunderstorm", (0.7, 1.0), 1, 2, (("Islandwide",),)),
+    (1.0, "Clear", None, 1, 4, (("Islandwide",),)),
+)
+_WEATHER_MORNING = (
+    (0.08, "Haze", (0.3, 0.7), 2, 5, (("Islandwide",),)),
+    (0.18, "Light Rain", (0.2, 0.4), 1, 2, (("Islandwide",),)),
+    (1.0, "Clear", None, 2, 4, (("Islandwide",),)),
+)
+_WEATHER_DEFAULT = (
+    (0.10, "Light Rain", (0.1, 0.3), 1, 2, (("Islandwide",),)),
+    (1.0, "Clear", None, 2, 5, (("Islandwide",),)),
+)
+
+def _build_weather_table():
+    """Per-hour (thresholds, rows) pairs for update_weather.
+
+    Afternoon hours (14-18) favour tropical rain, late morning (8-11)
+    carries a haze possibility; all other hours use the default profile.
+    """
+    table = []
+    for hour in range(24):
+        if 14 <= hour <= 18:
+            rows = _WEATHER_AFTERNOON
+        elif 8 <= hour <= 11:
+            rows = _WEATHER_MORNING
+        else:
+            rows = _WEATHER_DEFAULT
+        # Drop the final threshold: bisect maps rolls past it to the
+        # last row by falling off the end of the shorter list.
+        table.append((tuple(r[0] for r in rows[:-1]), rows))
+    return tuple(table)
+
+_WEATHER_TABLE = _build_weather_table()
 
 
-@dataclass
+@dataclass(slots=True)
 class CityState:
     """State of the entire city with cost-aware operations."""
     districts: List[DistrictState]
@@ -207,13 +353,65 @@ class CityState:
     # Weather
     weather: WeatherState = field(default_factory=WeatherState)
 
+    # Per-city RNG: bound instance avoids module-level dispatch and makes
+    # runs reproducible when seeded
+    _rng: random.Random = field(default_factory=random.Random, repr=False)
+
     # Events
     active_events: List[ActiveEvent] = field(default_factory=list)
-    event_log: List[Dict[str, Any]] = field(default_factory=list)
-
-    # Action logs and history
-    action_log: List[Dict[str, Any]] = field(default_factory=list)
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    event_log: deque = field(default_factory=lambda: deque(maxlen=LOG_MAXLEN))
+
+    # Action logs and history (bounded: O(1) append, auto-trimmed)
+    action_log: deque = field(default_factory=lambda: deque(maxlen=LOG_MAXLEN))
+    history: deque = field(default_factory=lambda: deque(maxlen=HISTORY_MAXLEN))
+
+    # Cached district count, name column, and name -> index /
+    # name -> district maps (all fixed after construction)
+    n_districts: int = field(init=False, default=0)
+    district_names: tuple = field(init=False, default=())
+    _district_index: Dict[str, int] = field(init=False, default_factory=dict)
+    districts_by_name: Dict[str, "DistrictState"] = field(
+        init=False, default_factory=dict)
+
+    # Bumped on in-place reset so per-tick caches keyed on (city, t)
+    # don't survive a reset back to t=0
+    reset_epoch: int = field(init=False, default=0)
+
+    # EVENTS narrowed to the ones that can touch a modelled district,
+    # so trigger rolls never land on an event with no effect here
+    _relevant_events: tuple = field(init=False, default=())
+
+    # Optional pre-drawn weather rolls for batch runs (see prepare_batch)
+    _weather_rolls: tuple = field(init=False, default=())
+    _weather_roll_i: int = field(init=False, default=0)
+
+    # Bumped whenever active_events changes (trigger, tick, expiry) so
+    # serialized views of the list can be cached against it
+    _events_rev: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        assert self.districts, "CityState requires at least one district"
+        self.n_districts = len(self.districts)
+        self.district_names = tuple(d.name for d in self.districts)
+        self._district_index = {d.name: i for i, d in enumerate(self.districts)}
+        self.districts_by_name = {d.name: d for d in self.districts}
+        district_set = set(self.district_names)
+        self._relevant_events = tuple(
+            e for e in EVENTS
+            if "all" in e.districts or district_set.intersection(e.districts)
+        )
+
+    def prepare_batch(self, n: int):
+        """Pre-draw the next n weather transition rolls.
+
+        Batch drivers (Monte Carlo sweeps, training loops) can draw the
+        per-tick condition rolls up front; update_weather consumes the
+        buffer and falls back to drawing lazily once it is exhausted.
+        Single-tick callers never need to call this.
+        """
+        _random = self._rng.random
+        self._weather_rolls = tuple(_random() for _ in range(n))
+        self._weather_roll_i = 0
 
     def reset_capacities(self):
         """Clear per-hour train line actions at the start of each step."""
@@ -226,8 +424,12 @@ class CityState:
         self.hourly_emissions += amount
         self.sustainability_score = max(0, self.sustainability_score - amount * 0.001)
 
-    def trigger_random_event(self) -> Optional[ActiveEvent]:
-        """Potentially trigger a random event."""
+    def trigger_random_event(self, roll: Optional[float] = None) -> Optional[ActiveEvent]:
+        """Potentially trigger a random event.
+
+        Accepts an optional pre-drawn uniform so callers running many
+        steps can draw their rolls up front.
+        """
         hour = self.hour_of_day
 
         base_chance = 0.05
@@ -239,20 +441,27 @@ class CityState:
         if len(self.active_events) >= 2:
             base_chance *= 0.3
 
-        if random.random() < base_chance:
-            event_data = random.choice(EVENTS)
+        if roll is None:
+            roll = self._rng.random()
+        if roll < base_chance:
+            event_data = self._rng.choices(self._relevant_events, k=1)[0]
             event = ActiveEvent(
-                event_id=event_data["id"],
-                name=event_data["name"],
-                icon=event_data["icon"],
-                districts=event_data["districts"],
-                demand_mult=event_data["demand_mult"],
-                remaining_hours=event_data["duration"],
-                reduces_mrt=event_data.get("reduces_mrt", False),
-                affected_lines=event_data.get("affected_lines", []),
-                road_incident=event_data.get("road_incident", False),
+                event_id=event_data.id,
+                name=event_data.name,
+                icon=event_data.icon,
+                districts=list(event_data.districts),
+                demand_mult=event_data.demand_mult,
+                remaining_hours=event_data.duration,
+                reduces_mrt=event_data.reduces_mrt,
+                affected_lines=list(event_data.affected_lines),
+                road_incident=event_data.road_incident,
+            )
+            event._district_ids = tuple(
+                self._district_index[n] for n in event.districts
+                if n in self._district_index
             )
             self.active_events.append(event)
+            self._events_rev += 1
             self.event_log.append({
                 "t": self.t,
                 "hour": self.hour_of_day,
@@ -264,25 +473,36 @@ class CityState:
 
     def update_events(self):
         """Tick down event timers and remove expired events."""
-        expired = []
+        if not self.active_events:
+            return
+        self._events_rev += 1
+        still_active = []
         for event in self.active_events:
             event.remaining_hours -= 1
             if event.remaining_hours <= 0:
-                expired.append(event)
                 self.event_log.append({
                     "t": self.t,
                     "type": "event_end",
                     "event_id": event.event_id,
                 })
-        for event in expired:
-            self.active_events.remove(event)
+            else:
+                still_active.append(event)
+        self.active_events = still_active
 
-        # Update district demand multipliers
-        for district in self.districts:
-            district.event_demand_mult = 1.0
-            for event in self.active_events:
-                if "all" in event.districts or district.name in event.districts:
-                    district.event_demand_mult *= event.demand_mult
+        # Update district demand multipliers: accumulate into a local
+        # column in one pass over the events, then scatter once per
+        # district, instead of re-scanning the event list per district.
+        mults = [1.0] * self.n_districts
+        for event in self.active_events:
+            m = event.demand_mult
+            if event.applies_to_all:
+                for i in range(self.n_districts):
+                    mults[i] *= m
+            else:
+                for i in event._district_ids:
+                    mults[i] *= m
+        for district, m in zip(self.districts, mults):
+            district.event_demand_mult = m
 
     def update_weather(self):
         """Evolve weather with persistence and hour-based transitions."""
@@ -291,57 +511,25 @@ class CityState:
             w.persistence_hours -= 1
             return
 
-        # Decide new weather based on hour and randomness
-        hour = self.hour_of_day
-        roll = random.random()
+        # Single roll against the precomputed transition table for this
+        # hour; batch runs consume pre-drawn rolls (see prepare_batch)
+        thresholds, rows = _WEATHER_TABLE[self.hour_of_day]
+        i = self._weather_roll_i
+        if i < len(self._weather_rolls):
+            roll = self._weather_rolls[i]
+            self._weather_roll_i = i + 1
+        else:
+            roll = self._rng.random()
+        _, condition, intensity_range, persist_lo, persist_hi, regions = \
+            rows[bisect.bisect_right(thresholds, roll)]
 
-        # Afternoon more likely rain (tropical Singapore pattern)
-        if 14 <= hour <= 18:
-            if roll < 0.15:
-                w.condition = "Heavy Rain"
-                w.intensity = round(random.uniform(0.6, 0.9), 2)
-                w.persistence_hours = random.randint(1, 3)
-                w.affected_regions = random.choice([["Islandwide"], ["East"], ["West", "Central"]])
-            elif roll < 0.35:
-                w.condition = "Light Rain"
-                w.intensity = round(random.uniform(0.2, 0.5), 2)
-                w.persistence_hours = random.randint(1, 2)
-                w.affected_regions = ["Islandwide"]
-            elif roll < 0.40:
-                w.condition = "Thunderstorm"
-                w.intensity = round(random.uniform(0.7, 1.0), 2)
-                w.persistence_hours = random.randint(1, 2)
-                w.affected_regions = ["Islandwide"]
-            else:
-                w.condition = "Clear"
-                w.intensity = 0.0
-                w.persistence_hours = random.randint(1, 4)
-                w.affected_regions = ["Islandwide"]
-        elif 8 <= hour <= 11:
-            # Morning haze possibility
-            if roll < 0.08:
-                w.condition = "Haze"
-                w.intensity = round(random.uniform(0.3, 0.7), 2)
-                w.persistence_hours = random.randint(2, 5)
-                w.affected_regions = ["Islandwide"]
-            elif roll < 0.18:
-                w.condition = "Light Rain"
-                w.intensity = round(random.uniform(0.2, 0.4), 2)
-                w.persistence_hours = random.randint(1, 2)
-                w.affected_regions = ["Islandwide"]
-            else:
-                w.condition = "Clear"
-                w.intensity = 0.0
-                w.persistence_hours = random.randint(2, 4)
-                w.affected_regions = ["Islandwide"]
+        w.condition = condition
+        if intensity_range is None:
+            w.intensity = 0.0
         else:
-            if roll < 0.10:
-                w.condition = "Light Rain"
-                w.intensity = round(random.uniform(0.1, 0.3), 2)
-                w.persistence_hours = random.randint(1, 2)
-                w.affected_regions = ["Islandwide"]
-            else:
-                w.condition = "Clear"
-                w.intensity = 0.0
-                w.persistence_hours = random.randint(2, 5)
-                w.affected_regions = ["Islandwide"]
+            w.intensity = round(self._rng.uniform(*intensity_range), 2)
+        w.persistence_hours = self._rng.randint(persist_lo, persist_hi)
+        if len(regions) == 1:
+            w.affected_regions = list(regions[0])
+        else:
+            w.affected_regions = list(self._rng.choice(regions))
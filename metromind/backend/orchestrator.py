@@ -2,9 +2,11 @@
 Orchestrator v2 — Single source of truth for simulation control.
 Integrates demand forecasting, cost tracking, and operator escalations.
 """
+from dataclasses import asdict, fields
+from types import MappingProxyType
 from typing import Dict, Any
 from .models import (
-    CityState, DistrictState, TrainLineState, TRAIN_LINE_DEFS,
+    CityState, DistrictState, TrainLineState, WeatherState, TRAIN_LINE_DEFS,
     COST_BUS_ACTIVE, COST_TRAIN_ACTIVE, COST_RESERVE_IDLE,
     COST_CROWDING_PENALTY, COST_DELAY_PENALTY, CROWDING_CRITICAL,
 )
@@ -28,38 +30,38 @@ HOUR_SCALE = {
     22: 0.25, 23: 0.18,
 }
 
+# Hour-indexed scale table derived from the above: the per-step path
+# indexes it by hour_of_day instead of hashing into the dict
+_HOUR_SCALE_TBL = tuple(HOUR_SCALE.get(h, 0.5) for h in range(24))
+
+# No-service hours as a bitmask for a branchless membership test
+_NO_SERVICE_MASK = sum(1 << h for h in NO_SERVICE_HOURS)
+
+
+# Initial district rows: (name, population, bus_capacity, mrt_capacity,
+# bus_load_factor, mrt_load_factor, station_crowding, road_traffic,
+# air_quality). base_*_capacity always starts equal to *_capacity.
+_DISTRICT_DEFS = (
+    ("Central", 500000, 120, 40, 0.08, 0.06, 0.05, 0.12, 85),
+    ("North", 350000, 80, 25, 0.05, 0.04, 0.03, 0.08, 88),
+    ("East", 380000, 85, 28, 0.06, 0.05, 0.04, 0.09, 87),
+    ("West", 320000, 75, 22, 0.05, 0.04, 0.03, 0.08, 86),
+)
+
 
 def make_city() -> CityState:
     """Create initial city state at midnight."""
     districts = [
         DistrictState(
-            name="Central", population=500000,
-            bus_capacity=120, mrt_capacity=40,
-            base_bus_capacity=120, base_mrt_capacity=40,
-            bus_load_factor=0.08, mrt_load_factor=0.06,
-            station_crowding=0.05, road_traffic=0.12, air_quality=85,
-        ),
-        DistrictState(
-            name="North", population=350000,
-            bus_capacity=80, mrt_capacity=25,
-            base_bus_capacity=80, base_mrt_capacity=25,
-            bus_load_factor=0.05, mrt_load_factor=0.04,
-            station_crowding=0.03, road_traffic=0.08, air_quality=88,
-        ),
-        DistrictState(
-            name="East", population=380000,
-            bus_capacity=85, mrt_capacity=28,
-            base_bus_capacity=85, base_mrt_capacity=28,
-            bus_load_factor=0.06, mrt_load_factor=0.05,
-            station_crowding=0.04, road_traffic=0.09, air_quality=87,
-        ),
-        DistrictState(
-            name="West", population=320000,
-            bus_capacity=75, mrt_capacity=22,
-            base_bus_capacity=75, base_mrt_capacity=22,
-            bus_load_factor=0.05, mrt_load_factor=0.04,
-            station_crowding=0.03, road_traffic=0.08, air_quality=86,
-        ),
+            name=name, population=pop,
+            bus_capacity=bus_cap, mrt_capacity=mrt_cap,
+            base_bus_capacity=bus_cap, base_mrt_capacity=mrt_cap,
+            bus_load_factor=bus_lf, mrt_load_factor=mrt_lf,
+            station_crowding=crowding, road_traffic=traffic,
+            air_quality=air,
+        )
+        for (name, pop, bus_cap, mrt_cap, bus_lf, mrt_lf,
+             crowding, traffic, air) in _DISTRICT_DEFS
     ]
 
     # Create train lines
@@ -92,15 +94,80 @@ def make_city() -> CityState:
         districts=districts,
         train_lines=train_lines,
         t=0, hour_of_day=0, day_index=1,
-        action_log=[], history=[],
         bus_service_units_active=bus_active,
         train_service_units_active=train_active,
         cost_this_hour=round(initial_cost, 1),
     )
 
 
+def reset_city_state(city: CityState) -> CityState:
+    """Reset an existing CityState back to the initial midnight state.
+
+    Overwrites the long-lived district/train-line/weather objects in
+    place and clears the log containers rather than rebinding a fresh
+    city, so references held by concurrent readers (e.g. /api/state in
+    FastAPI's threadpool) never observe a half-swapped instance.
+    """
+    fresh = make_city()
+
+    for district, init in zip(city.districts, fresh.districts):
+        for f in fields(DistrictState):
+            setattr(district, f.name, getattr(init, f.name))
+
+    for line_id, line in city.train_lines.items():
+        init = fresh.train_lines[line_id]
+        for f in fields(TrainLineState):
+            setattr(line, f.name, getattr(init, f.name))
+
+    for f in fields(WeatherState):
+        setattr(city.weather, f.name, getattr(fresh.weather, f.name))
+
+    city.t = 0
+    city.hour_of_day = 0
+    city.day_index = 1
+    city.bus_service_units_active = fresh.bus_service_units_active
+    city.train_service_units_active = fresh.train_service_units_active
+    city.carbon_emissions = 0.0
+    city.hourly_emissions = 0.0
+    city.sustainability_score = 100.0
+    city.cost_this_hour = fresh.cost_this_hour
+    city.cost_today = 0.0
+    city.cost_history.clear()
+    city.operator_escalations.clear()
+    city.active_events.clear()
+    city.event_log.clear()
+    city.action_log.clear()
+    city.history.clear()
+    city.reset_epoch += 1
+    return city
+
+
 def _is_no_service(hour: int) -> bool:
-    return hour in NO_SERVICE_HOURS
+    return bool((_NO_SERVICE_MASK >> hour) & 1)
+
+
+def json_default(obj):
+    """orjson `default` hook for payload types it cannot encode natively.
+
+    The KPI dicts stored in payloads and history are MappingProxyType
+    views (see kpi.py); everything else in a payload is already plain
+    str/int/float/bool/list/dict.
+    """
+    if isinstance(obj, MappingProxyType):
+        return obj.copy()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _set_service_units(city: CityState, hour: int) -> bool:
+    """Set active service units for `hour`; True if it is a no-service hour."""
+    if (_NO_SERVICE_MASK >> hour) & 1:
+        city.bus_service_units_active = 0
+        city.train_service_units_active = 0
+        return True
+    scale = _HOUR_SCALE_TBL[hour]
+    city.bus_service_units_active = round(city.bus_service_units_max * scale)
+    city.train_service_units_active = round(city.train_service_units_max * scale)
+    return False
 
 
 class Orchestrator:
@@ -114,21 +181,37 @@ class Orchestrator:
         self.coordinator = CoordinatorAgent()
         self.executor = ExecutionAgent()
         self.forecaster = DemandForecaster()
+        # Last computed (metrics, scores), keyed on the owning city and
+        # tick so get_state between steps reuses the step's KPI pass
+        self._kpi_key = None
+        self._kpi_val = None
+        # Per-tick cache for the districts/train_lines payload blocks;
+        # the per-object to_dict caches make rebuilds cheap, this skips
+        # the outer dict construction as well between state polls
+        self._view_key = None
+        self._districts_view = None
+        self._lines_view = None
+        self._environment_view = None
+        # Serialized active-events list, cached against the city's
+        # event revision counter (stable while no event starts/ticks)
+        self._events_key = None
+        self._events_view = None
+
+    def _kpis(self, city: CityState):
+        """Return (metrics, scores), memoized per (city, epoch, tick)."""
+        key = (id(city), city.reset_epoch, city.t)
+        if key != self._kpi_key:
+            self._kpi_val = (snapshot_metrics(city), score(city))
+            self._kpi_key = key
+        return self._kpi_val
 
     def step(self, city: CityState) -> Dict[str, Any]:
         """Run one full simulation step."""
         city.reset_capacities()
 
         current_hour = city.hour_of_day
-        no_service = _is_no_service(current_hour)
-
-        scale = HOUR_SCALE.get(current_hour, 0.5)
-        city.bus_service_units_active = round(city.bus_service_units_max * scale)
-        city.train_service_units_active = round(city.train_service_units_max * scale)
-
+        no_service = _set_service_units(city, current_hour)
         if no_service:
-            city.bus_service_units_active = 0
-            city.train_service_units_active = 0
             self._apply_no_service(city)
 
         observations = self.monitor.observe(city)
@@ -168,18 +251,18 @@ class Orchestrator:
         else:
             # Pass forecast to planner (v2)
             proposals = self.planner.propose(city, observations, forecast_data)
+            # Snapshot proposals for the trace before policy/coordinator
+            # mutate the slot-based instances in place.
             agent_trace["planner"] = {
-                "bus_proposals": proposals["district_proposals"],
-                "train_proposals": proposals["train_proposals"],
+                "bus_proposals": [asdict(p) for p in proposals["district_proposals"]],
+                "train_proposals": [asdict(p) for p in proposals["train_proposals"]],
                 "reasoning": proposals.get("reasoning", []),
             }
 
-            sanitized = self.policy.sanitize(proposals, observations)
-            policy_trace = sanitized.pop("_trace", {"adjustments": [], "blocked": []})
+            sanitized, policy_trace = self.policy.sanitize(proposals, observations)
             agent_trace["policy"] = policy_trace
 
-            approved = self.coordinator.allocate(city, sanitized)
-            coord_trace = approved.pop("_trace", {"allocations": [], "remaining_capacity": {}})
+            approved, coord_trace = self.coordinator.allocate(city, sanitized)
             agent_trace["coordinator"] = coord_trace
 
             step_actions = self.executor.execute(city, approved)
@@ -203,15 +286,9 @@ class Orchestrator:
         agent_trace["no_service"] = _is_no_service(city.hour_of_day)
 
         # Recompute service units for the NEW hour
-        new_hour = city.hour_of_day
-        new_scale = HOUR_SCALE.get(new_hour, 0.5)
-        if _is_no_service(new_hour):
-            city.bus_service_units_active = 0
-            city.train_service_units_active = 0
+        if _set_service_units(city, city.hour_of_day):
             city.cost_this_hour = 0  # no operating cost during no-service hours
         else:
-            city.bus_service_units_active = round(city.bus_service_units_max * new_scale)
-            city.train_service_units_active = round(city.train_service_units_max * new_scale)
             # Restore train frequency after no-service hours
             for line in city.train_lines.values():
                 if line.frequency < line.base_frequency:
@@ -222,15 +299,14 @@ class Orchestrator:
         # Regenerate forecast for display (based on NEW hour after step)
         display_forecast = self.forecaster.forecast(city)
 
-        metrics = snapshot_metrics(city)
-        scores = score(city)
+        metrics, scores = self._kpis(city)
 
         city.history.append({
             "t": city.t,
             "hour": city.hour_of_day,
             "day": city.day_index,
-            "scores": scores.copy(),
-            "metrics": metrics.copy(),
+            "scores": scores,
+            "metrics": metrics,
         })
 
         payload = self._build_payload(city, metrics, scores, step_actions)
@@ -247,9 +323,8 @@ class Orchestrator:
 
     def get_state(self, city: CityState) -> Dict[str, Any]:
         """Get current state without stepping."""
-        metrics = snapshot_metrics(city)
-        scores = score(city)
-        recent_actions = city.action_log[-20:] if city.action_log else []
+        metrics, scores = self._kpis(city)
+        recent_actions = list(city.action_log)[-20:] if city.action_log else []
         payload = self._build_payload(city, metrics, scores, recent_actions)
         payload["no_service"] = _is_no_service(city.hour_of_day)
         payload["cost"] = {
@@ -289,6 +364,26 @@ class Orchestrator:
 
     def _build_payload(self, city: CityState, metrics: dict, scores: dict,
                        actions: list) -> Dict[str, Any]:
+        key = (id(city), city.reset_epoch, city.t)
+        if key != self._view_key:
+            self._districts_view = {d.name: d.to_dict() for d in city.districts}
+            self._lines_view = {
+                lid: l.to_dict() for lid, l in city.train_lines.items()}
+            self._environment_view = {
+                "carbon_emissions": round(city.carbon_emissions, 1),
+                "hourly_emissions": round(city.hourly_emissions, 1),
+                "sustainability_score": round(city.sustainability_score, 1),
+            }
+            self._view_key = key
+        events_key = (id(city), city.reset_epoch, city._events_rev)
+        if events_key != self._events_key:
+            self._events_view = [e.to_dict() for e in city.active_events]
+            self._events_key = events_key
+        # The top-level dict (and its time/capacities leaves) is fresh
+        # per call: sync handlers run in FastAPI's threadpool alongside
+        # the event loop, so a shared skeleton could be mutated here
+        # while another request is serializing it. The per-tick views
+        # above are safe to share — they are rebound, never mutated.
         return {
             "time": {
                 "t": city.t,
@@ -298,8 +393,8 @@ class Orchestrator:
             "scores": scores,
             "metrics": metrics,
             "weather": city.weather.to_dict(),
-            "districts": {d.name: d.to_dict() for d in city.districts},
-            "train_lines": {lid: l.to_dict() for lid, l in city.train_lines.items()},
+            "districts": self._districts_view,
+            "train_lines": self._lines_view,
             "actions": actions,
             "capacities": {
                 "bus_service_units_active": city.bus_service_units_active,
@@ -307,12 +402,8 @@ class Orchestrator:
                 "train_service_units_active": city.train_service_units_active,
                 "train_service_units_max": city.train_service_units_max,
             },
-            "environment": {
-                "carbon_emissions": round(city.carbon_emissions, 1),
-                "hourly_emissions": round(city.hourly_emissions, 1),
-                "sustainability_score": round(city.sustainability_score, 1),
-            },
-            "active_events": [e.to_dict() for e in city.active_events],
-            "history_tail": city.history[-50:],
+            "environment": self._environment_view,
+            "active_events": self._events_view,
+            "history_tail": list(city.history)[-50:],
             "no_service": _is_no_service(city.hour_of_day),
         }